@@ -1,4 +1,5 @@
 import ast
+import functools
 import inspect
 from collections.abc import Callable
 from enum import Enum, auto
@@ -106,6 +107,7 @@ def transform_union(value: UnionType) -> Any:
     return "typing.Union[" + (", ".join(get_fancy_repr(a) for a in get_args(value))) + "]"
 
 
+@functools.cache
 def transform_lambda(value: LambdaType) -> Any:
     # We clean source because getsource() can return only a part of the expression which
     # on its own is not a valid expression such as: "\n  .had(default_factory=lambda: 91)"
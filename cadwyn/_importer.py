@@ -1,4 +1,5 @@
 import importlib
+import sys
 from typing import Any
 
 from cadwyn.exceptions import ImportFromStringError
@@ -23,6 +24,10 @@ def import_attribute_from_string(import_str: str) -> Any:
 
 
 def import_module_from_string(module_str: str):
+    # Already-imported modules can be returned directly without re-entering the import machinery
+    # and taking its locks.
+    if (module := sys.modules.get(module_str)) is not None:
+        return module
     try:
         return importlib.import_module(module_str)
     except ModuleNotFoundError as e:
@@ -1,7 +1,10 @@
 import ast
+import copy
+import functools
 import inspect
 import textwrap
 from enum import Enum
+from types import ModuleType
 from typing import TYPE_CHECKING
 
 import typer
@@ -27,14 +30,20 @@ if TYPE_CHECKING:
 def render_module_by_path(module_path: str, app_path: str, version: str):
     module = import_module_from_string(module_path)
     app: Cadwyn = import_attribute_from_string(app_path)
-    attributes_to_alter = [
+    attributes_to_alter = frozenset(
         name
         for name, value in module.__dict__.items()
         if lenient_issubclass(value, Enum | BaseModel) and value.__module__ == module.__name__
-    ]
+    )
+    if not attributes_to_alter:
+        # There is nothing to rewrite so we can skip the whole AST round-trip and return the source as is
+        try:
+            return inspect.getsource(module)
+        except (OSError, TypeError) as e:  # pragma: no cover
+            raise CadwynRenderError(f"Failed to find the source for module {module.__name__}") from e
 
     try:
-        module_ast = ast.parse(inspect.getsource(module))
+        module_ast = copy.deepcopy(_parse_module_source(module))
     except (OSError, SyntaxError, ValueError) as e:  # pragma: no cover
         raise CadwynRenderError(f"Failed to find the source for module {module.__name__}") from e
 
@@ -60,7 +69,7 @@ def render_model_by_path(model_path: str, app_path: str, version: str) -> str:
 
 def render_model(model: type[BaseModel | Enum], versions: VersionBundle, version: str) -> str:
     try:
-        original_cls_node = ast.parse(textwrap.dedent(inspect.getsource(model))).body[0]
+        original_cls_node = copy.deepcopy(_parse_model_source(model))
     except (OSError, SyntaxError, ValueError):  # pragma: no cover
         typer.echo(f"Failed to find the source for model {get_cls_pythonpath(model)}")
         return f"class {model.__name__}: 'failed to find the original class source'"
@@ -70,6 +79,17 @@ def render_model(model: type[BaseModel | Enum], versions: VersionBundle, version
     return ast.unparse(_render_model_from_ast(original_cls_node, model, versions, version))
 
 
+# Rendering mutates the parsed nodes so the cached trees must be deepcopied before use.
+@functools.cache
+def _parse_module_source(module: ModuleType) -> ast.Module:
+    return ast.parse(inspect.getsource(module))
+
+
+@functools.cache
+def _parse_model_source(model: type[BaseModel | Enum]) -> ast.stmt:
+    return ast.parse(textwrap.dedent(inspect.getsource(model))).body[0]
+
+
 def _render_model_from_ast(
     model_ast: ast.ClassDef, model: type[BaseModel | Enum], versions: VersionBundle, version: str
 ):
@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, Union
 
@@ -48,7 +49,9 @@ if TYPE_CHECKING:
     lenient_issubclass = issubclass
 
 else:
-
+    # issubclass walks the whole MRO on every call so we cache the answers. Both arguments are
+    # classes (or unions of classes) from a small fixed set, which keeps the cache bounded.
+    @functools.lru_cache(maxsize=1024)
     def lenient_issubclass(cls: type, other: T | tuple[T, ...]) -> bool:
         try:
             return issubclass(cls, other)
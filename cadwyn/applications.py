@@ -32,7 +32,7 @@ from cadwyn.route_generation import generate_versioned_routers
 from cadwyn.routing import _RootHeaderAPIRouter
 from cadwyn.structure import VersionBundle
 
-CURR_DIR = Path(__file__).resolve()
+_STATIC_DIR = Path(__file__).resolve().parent / "static"
 logger = getLogger(__name__)
 
 
@@ -42,7 +42,7 @@ class FakeDependencyOverridesProvider:
 
 
 class Cadwyn(FastAPI):
-    _templates = Jinja2Templates(directory=CURR_DIR.parent / "static")
+    _templates = Jinja2Templates(directory=_STATIC_DIR)
 
     def __init__(
         self,
@@ -99,6 +99,7 @@ class Cadwyn(FastAPI):
         self.versions = versions
         self._dependency_overrides_provider = FakeDependencyOverridesProvider({})
         self._cadwyn_initialized = False
+        self._cached_changelog: CadwynChangelogResource | None = None
 
         super().__init__(
             debug=debug,
@@ -219,7 +220,14 @@ class Cadwyn(FastAPI):
         self._dependency_overrides_provider.dependency_overrides = value
 
     def generate_changelog(self) -> CadwynChangelogResource:
-        return _generate_changelog(self.versions, self.router)
+        if self._cached_changelog is not None:
+            return self._cached_changelog
+        changelog = _generate_changelog(self.versions, self.router)
+        # The changelog is a pure function of the versions and the generated routers so it can be
+        # safely reused once the app has finished generating its routes.
+        if self._cadwyn_initialized:
+            self._cached_changelog = changelog
+        return changelog
 
     def _add_utility_endpoints(self, unversioned_router: APIRouter):
         if self.changelog_url is not None:
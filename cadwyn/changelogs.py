@@ -348,11 +348,6 @@ def _convert_version_change_instruction_to_changelog_entry(  # noqa: C901
                     CadwynEndpointAttributeChange(name="summary", new_value=instruction.attributes.name)
                 )
 
-            if any(
-                getattr(instruction.attributes, attr) is not Sentinel
-                for attr in ["path", "methods", "summary", "description", "tags", "deprecated"]
-            ):
-                pass
             if any(
                 attr is not Sentinel
                 for attr in [
@@ -129,8 +129,9 @@ class _EndpointTransformer(Generic[_R, _WR]):
         webhook_routers: dict[VersionDate, _WR] = {}
 
         for version in self.versions:
-            self.schema_generators[str(version.value)].annotation_transformer.migrate_router_to_version(router)
-            self.schema_generators[str(version.value)].annotation_transformer.migrate_router_to_version(webhook_router)
+            annotation_transformer = self.schema_generators[str(version.value)].annotation_transformer
+            annotation_transformer.migrate_router_to_version(router)
+            annotation_transformer.migrate_router_to_version(webhook_router)
 
             self._validate_all_data_converters_are_applied(router, version)
 
@@ -4,6 +4,7 @@ import functools
 import inspect
 import types
 import typing
+import weakref
 from collections.abc import Callable, Sequence
 from datetime import date
 from enum import Enum
@@ -67,6 +68,7 @@ if TYPE_CHECKING:
 _Call = TypeVar("_Call", bound=Callable[..., Any])
 
 _FieldName: TypeAlias = str
+_BASEMODEL_OR_ENUM = BaseModel | Enum
 _T_ANY_MODEL = TypeVar("_T_ANY_MODEL", bound=BaseModel | Enum)
 _T_ENUM = TypeVar("_T_ENUM", bound=Enum)
 
@@ -149,7 +151,8 @@ class _RuntimeSchemaGenContext:
     latest_version: "Version" = dataclasses.field(init=False)
 
     def __post_init__(self):
-        self.latest_version = max(self.version_bundle.versions, key=lambda v: v.value)
+        # Versions are validated to be sorted in descending order at VersionBundle creation
+        self.latest_version = self.version_bundle.versions[0]
 
 
 def migrate_response_body(
@@ -267,6 +270,13 @@ def _wrap_pydantic_model(model: type[_T_PYDANTIC_MODEL]) -> "_PydanticModelWrapp
     )
 
 
+# Wrapping a non-versioned parent model inspects it from scratch, which is much more expensive
+# than deepcopying an already built wrapper, so we build each one once and hand out copies.
+_unversioned_parent_wrappers: "weakref.WeakKeyDictionary[type[BaseModel], _PydanticModelWrapper]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 @final
 @dataclasses.dataclass(slots=True)
 class _PydanticModelWrapper(Generic[_T_PYDANTIC_MODEL]):
@@ -306,7 +316,8 @@ class _PydanticModelWrapper(Generic[_T_PYDANTIC_MODEL]):
             doc=self.doc,
             fields=copy.deepcopy(self.fields),
             validators=copy.deepcopy(self.validators),
-            other_attributes=copy.deepcopy(self.other_attributes),
+            # No migration instruction ever mutates other attributes so copying the container is enough
+            other_attributes=self.other_attributes.copy(),
             annotations=copy.deepcopy(self.annotations),
         )
         memo[id(self)] = result
@@ -323,7 +334,10 @@ class _PydanticModelWrapper(Generic[_T_PYDANTIC_MODEL]):
             if base in schemas:
                 parents.append(schemas[base])
             elif lenient_issubclass(base, BaseModel):
-                parents.append(_wrap_pydantic_model(base))
+                if base not in _unversioned_parent_wrappers:
+                    _unversioned_parent_wrappers[base] = _wrap_pydantic_model(base)
+                # Migrations can mutate inherited fields in place so each caller gets its own copy
+                parents.append(copy.deepcopy(_unversioned_parent_wrappers[base]))
         self._parents = parents
         return parents
 
@@ -355,14 +369,15 @@ class _PydanticModelWrapper(Generic[_T_PYDANTIC_MODEL]):
             if not validator.is_deleted and type(validator) == _ValidatorWrapper  # noqa: E721
         }
         fields = {name: field.generate_field_copy(generator) for name, field in self.fields.items()}
+        # A single unpacking merge builds the namespace without allocating an intermediate dict per "|"
         model_copy = type(self.cls)(
             self.name,
             tuple(generator[cast(type[BaseModel], base)] for base in self.cls.__bases__),
-            self.other_attributes
-            | per_field_validators
-            | root_validators
-            | fields
-            | {
+            {
+                **self.other_attributes,
+                **per_field_validators,
+                **root_validators,
+                **fields,
                 "__annotations__": generator.annotation_transformer.change_version_of_annotation(self.annotations),
                 "__doc__": self.doc,
                 "__qualname__": self.cls.__qualname__.removesuffix(self.cls.__name__) + self.name,
@@ -429,14 +444,13 @@ class _AnnotationTransformer:
         replace "UserResponse" with the the same class but from the "2022-11-16" version.
 
         """
+        # The bound method is rebound to a local so the containers' comprehensions don't pay
+        # an attribute lookup per element
+        change = self.change_version_of_annotation
         if isinstance(annotation, dict):
-            return {
-                self.change_version_of_annotation(key): self.change_version_of_annotation(value)
-                for key, value in annotation.items()
-            }
-
+            return {change(key): change(value) for key, value in annotation.items()}
         elif isinstance(annotation, list | tuple):
-            return type(annotation)(self.change_version_of_annotation(v) for v in annotation)
+            return type(annotation)(change(v) for v in annotation)
         else:
             return self.change_versions_of_a_non_container_annotation(annotation)
 
@@ -505,7 +519,7 @@ class _AnnotationTransformer:
             return annotation
 
     def _change_version_of_type(self, annotation: type):
-        if lenient_issubclass(annotation, BaseModel | Enum):
+        if lenient_issubclass(annotation, _BASEMODEL_OR_ENUM):
             return self.generator[annotation]
         else:
             return annotation
@@ -623,7 +637,7 @@ class SchemaGenerator:
     def __getitem__(self, model: type[_T_ANY_MODEL], /) -> type[_T_ANY_MODEL]:
         if (
             not isinstance(model, type)
-            or not lenient_issubclass(model, BaseModel | Enum)
+            or not lenient_issubclass(model, _BASEMODEL_OR_ENUM)
             or model in (BaseModel, RootModel)
         ):
             return model
@@ -631,8 +645,6 @@ class SchemaGenerator:
 
         if model in self.concrete_models:
             return self.concrete_models[model]
-        else:
-            wrapper = self._get_wrapper_for_model(model)
 
         wrapper = self._get_wrapper_for_model(model)
         model_copy = wrapper.generate_model_copy(self)
@@ -673,11 +685,23 @@ def generate_versioned_models(versions: "VersionBundle") -> "dict[str, SchemaGen
     context = _RuntimeSchemaGenContext(current_version=versions.head_version, models=models, version_bundle=versions)
     _migrate_classes(context)
 
-    for version in versions.versions:
+    # Versions whose changes contain no schema or enum instructions see the exact same models as the
+    # version that precedes them so they can share its generator instead of deepcopying the bundle again.
+    generator: SchemaGenerator | None = None
+    for version in versions.versions[:-1]:
         context = _RuntimeSchemaGenContext(current_version=version, models=models, version_bundle=versions)
-        version_to_context_map[str(version.value)] = SchemaGenerator(copy.deepcopy(models))
-        # note that the last migration will not contain any version changes so we don't need to save the results
+        if generator is None:
+            generator = SchemaGenerator(copy.deepcopy(models))
+        version_to_context_map[str(version.value)] = generator
         _migrate_classes(context)
+        if any(change.alter_schema_instructions or change.alter_enum_instructions for change in version.changes):
+            generator = None
+
+    if generator is None:
+        # The first version is guaranteed to have no version changes so there is nothing left to migrate and
+        # its generator can take ownership of the remaining models without another defensive copy.
+        generator = SchemaGenerator(models)
+    version_to_context_map[str(versions.versions[-1].value)] = generator
 
     return version_to_context_map
 
@@ -836,7 +860,6 @@ def _change_field_in_model(
             version_change_name,
             defined_annotations,
             field,
-            model.annotations[alter_schema_instruction.name],
         )
     else:
         _delete_field_attributes(
@@ -854,7 +877,6 @@ def _change_field(
     version_change_name: str,
     defined_annotations: dict[str, Any],
     field: PydanticFieldWrapper,
-    annotation: Any | None,
 ):
     if alter_schema_instruction.type is not Sentinel:
         if field.annotation == alter_schema_instruction.type:
@@ -963,6 +985,7 @@ class _EnumWrapper(Generic[_T_ENUM]):
         return model_copy
 
     @staticmethod
+    @cache
     def _get_initialization_namespace_for_enum(enum_cls: type[Enum]):
         mro_without_the_class_itself = enum_cls.mro()[1:]
 
@@ -36,12 +36,13 @@ class RequestInfo:
 
 # TODO (https://github.com/zmievsa/cadwyn/issues/111): handle _response.media_type and _response.background
 class ResponseInfo:
-    __slots__ = ("_response", "body")
+    __slots__ = ("_migrations_applied", "_response", "body")
 
     def __init__(self, response: Response, body: Any):
         super().__init__()
         self.body = body
         self._response = response
+        self._migrations_applied = False
 
     @property
     def status_code(self) -> int:
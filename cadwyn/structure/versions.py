@@ -330,6 +330,40 @@ class VersionBundle:
             for instruction in version_change.alter_enum_instructions
         }
 
+    @functools.cached_property
+    def _versions_with_request_migrations(self) -> tuple[tuple[VersionDate, tuple[type[VersionChange], ...]], ...]:
+        """Version changes that contain request migrations, from the oldest version to the newest one.
+
+        Most version changes only alter schemas or endpoints so indexing the ones with data migrations
+        beforehand lets us skip the rest on every request.
+        """
+        chain = []
+        for version in reversed(self.versions):
+            changes = tuple(
+                version_change
+                for version_change in version.changes
+                if version_change.alter_request_by_schema_instructions
+                or version_change.alter_request_by_path_instructions
+            )
+            if changes:
+                chain.append((version.value, changes))
+        return tuple(chain)
+
+    @functools.cached_property
+    def _versions_with_response_migrations(self) -> tuple[tuple[VersionDate, tuple[type[VersionChange], ...]], ...]:
+        """Version changes that contain response migrations, from the newest version to the oldest one."""
+        chain = []
+        for version in self.versions:
+            changes = tuple(
+                version_change
+                for version_change in version.changes
+                if version_change.alter_response_by_schema_instructions
+                or version_change.alter_response_by_path_instructions
+            )
+            if changes:
+                chain.append((version.value, changes))
+        return tuple(chain)
+
     def _get_closest_lesser_version(self, version: VersionDate):
         for defined_version in self.version_dates:
             if defined_version <= version:
@@ -358,10 +392,10 @@ class VersionBundle:
         background_tasks: BackgroundTasks | None,
     ) -> dict[str, Any]:
         method = request.method
-        for v in reversed(self.versions):
-            if v.value <= current_version:
+        for version_value, version_changes in self._versions_with_request_migrations:
+            if version_value <= current_version:
                 continue
-            for version_change in v.changes:
+            for version_change in version_changes:
                 if body_type is not None and body_type in version_change.alter_request_by_schema_instructions:
                     for instruction in version_change.alter_request_by_schema_instructions[body_type]:
                         instruction(request_info)
@@ -396,10 +430,10 @@ class VersionBundle:
         path: str,
         method: str,
     ) -> ResponseInfo:
-        for v in self.versions:
-            if v.value <= current_version:
+        for version_value, version_changes in self._versions_with_response_migrations:
+            if version_value <= current_version:
                 break
-            for version_change in v.changes:
+            for version_change in version_changes:
                 migrations_to_apply: list[_BaseAlterResponseInstruction] = []
 
                 if head_response_model and head_response_model in version_change.alter_response_by_schema_instructions:
@@ -414,6 +448,7 @@ class VersionBundle:
 
                 for migration in migrations_to_apply:
                     if response_info.status_code < 300 or migration.migrate_http_errors:
+                        response_info._migrations_applied = True
                         migration(response_info)
         return response_info
 
@@ -577,8 +612,14 @@ class VersionBundle:
 
             # We skip cases without "body" attribute because of StreamingResponse and FileResponse
             # that do not have it. We don't support it too.
-            if response_info.body is not None and hasattr(response_info._response, "body"):
-                # TODO (https://github.com/zmievsa/cadwyn/issues/51): Only do this if there are migrations
+
+            # If no migrations were applied, the original response body is untouched and already has
+            # a consistent content-length so there is nothing to re-serialize.
+            if (
+                response_info.body is not None
+                and response_info._migrations_applied
+                and hasattr(response_info._response, "body")
+            ):
                 if (
                     isinstance(response_info.body, str)
                     and response_info._response.headers.get("content-type") != "application/json"
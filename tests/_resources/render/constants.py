@@ -0,0 +1,2 @@
+# This module intentionally contains no models or enums
+MY_CONSTANT = 83
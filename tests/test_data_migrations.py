@@ -617,6 +617,26 @@ class TestResponseMigrations:
         )
         assert resp.status_code == 200
 
+    def test__fastapi_response_migration__response_has_a_body_and_there_is_no_migration__body_is_not_reserialized(
+        self,
+        create_versioned_clients: CreateVersionedClients,
+        test_path: Literal["/test"],
+        router: VersionedAPIRouter,
+    ):
+        @router.post(test_path, response_model=AnyResponseSchema)
+        async def post_endpoint(request: Request):
+            return Response(content='{"hewwo":   "darkness"}', media_type="application/json")
+
+        clients = create_versioned_clients(version_change())
+        resp = clients[date(2000, 1, 1)].post(test_path, json={})
+        # The body is returned exactly as the endpoint produced it, without a re-serialization pass
+        assert resp.content == b'{"hewwo":   "darkness"}'
+        assert resp.status_code == 200
+
+        resp = clients[date(2001, 1, 1)].post(test_path, json={})
+        assert resp.content == b'{"hewwo":   "darkness"}'
+        assert resp.status_code == 200
+
     def test__fastapi_response_migration__with_custom_response(
         self,
         create_versioned_clients: CreateVersionedClients,
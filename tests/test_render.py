@@ -93,6 +93,15 @@ def test__render_model__with_non_existent_module():
         render_model_by_path("tests._resources.render.complex.KWASSES:ModelWithWeirdFields", "", "")
 
 
+def test__render_module__without_models__should_return_source_unchanged():
+    result = render_module_by_path(
+        "tests._resources.render.constants",
+        "tests._resources.render.versions:app",
+        "2000-01-01",
+    )
+    assert result == "# This module intentionally contains no models or enums\nMY_CONSTANT = 83\n"
+
+
 def test__render_module__with_non_existent_module():
     with pytest.raises(
         ImportFromStringError, match=re.escape('Could not import module "tests._resources.render.complex.KWASSES".')
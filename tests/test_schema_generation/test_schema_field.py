@@ -559,6 +559,23 @@ def test__schema_field_had_name(create_runtime_schemas: CreateRuntimeSchemas):
     assert_models_are_equal(schemas["2000-01-01"][SchemaWithOneStrField], ExpectedSchema)
 
 
+def test__schema_field_had__field_is_inherited_from_non_versioned_parent__parent_wrapper_is_not_polluted(
+    create_runtime_schemas: CreateRuntimeSchemas,
+):
+    class NonVersionedParent(BaseModel):
+        foo: str
+
+    class VersionedChild(NonVersionedParent):
+        pass
+
+    for _ in range(2):
+        schemas = create_runtime_schemas(
+            version_change(schema(VersionedChild).field("foo").had(description="mydescription"))
+        )
+
+        assert schemas["2000-01-01"][VersionedChild].model_fields["foo"].description == "mydescription"
+
+
 def my_default_factory():
     raise NotImplementedError
 